@@ -0,0 +1,89 @@
+import functools
+import os
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson is not installed
+    orjson = None
+    import json
+
+    # Built once; json.dumps() would construct a new encoder on every call
+    _ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+    _COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps(data):
+    # Same layout as json.dump(..., ensure_ascii=False, indent=2), as UTF-8 bytes
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # encode() joins the iterencode() chunks into one str, encoded once
+    return _ENCODER.encode(data).encode('utf-8')
+
+
+def dumps_compact(data):
+    # Minified UTF-8 bytes, only for build output; the tracked locale
+    # sources always use the indented layout from dumps()
+    if orjson is not None:
+        return orjson.dumps(data)
+    return _COMPACT_ENCODER.encode(data).encode('utf-8')
+
+
+def read_json(path):
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+@functools.lru_cache(maxsize=None)
+def _read_cached(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def load_locale(path):
+    # The file is read once per process, but every call parses its own dict,
+    # so callers are free to modify what they get back
+    return loads(_read_cached(path))
+
+
+# O_BINARY keeps Windows from translating newlines on the raw fd
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def write_bytes(path, buf):
+    # Whole buffer in one write call, no TextIOWrapper in between.
+    # Written next to the target and renamed over it, so a crash mid-write
+    # never leaves a truncated translation file behind.
+    tmp = path + '.tmp'
+    fd = os.open(tmp, _WRITE_FLAGS, 0o644)
+    try:
+        try:
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    finally:
+        # Cached bytes for this file are stale even if the write failed halfway
+        _read_cached.cache_clear()
+
+
+def write_many(items):
+    # items: (path, bytes) pairs, all serialized up front so a failure
+    # never leaves one locale written and the other not
+    for path, buf in items:
+        write_bytes(path, buf)
+
+
+def write_json(path, data):
+    write_many([(path, dumps(data))])
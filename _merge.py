@@ -0,0 +1,69 @@
+def flatten(d, prefix=()):
+    # Yield (path, value) for every leaf of a nested dict, depth first.
+    # A stack of item iterators instead of nested generators, so a deep
+    # leaf isn't passed up through one generator frame per level.
+    stack = [(prefix, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            if isinstance(v, dict):
+                stack.append((prefix + (k,), iter(v.items())))
+                break
+            yield prefix + (k,), v
+        else:
+            stack.pop()
+
+
+_MISSING = object()
+
+
+def apply_paths(data, items):
+    # Merges the leaves into data in place; a non-dict found along a path is
+    # replaced by a fresh dict, so patch constants are never aliased into data.
+    # Returns whether anything in data actually changed.
+    changed = False
+    for path, value in items:
+        cur = data
+        for key in path[:-1]:
+            nxt = cur.get(key)
+            if not isinstance(nxt, dict):
+                nxt = cur[key] = {}
+                changed = True
+            cur = nxt
+        key = path[-1]
+        if cur.get(key, _MISSING) != value:
+            cur[key] = value
+            changed = True
+    return changed
+
+
+def group_paths(items):
+    # Fold consecutive leaves that share a parent into (parent, {key: value})
+    # runs. Only consecutive ones, so key order in new dicts is unchanged.
+    groups = []
+    for path, value in items:
+        parent = path[:-1]
+        if groups and groups[-1][0] == parent:
+            groups[-1][1][path[-1]] = value
+        else:
+            groups.append((parent, {path[-1]: value}))
+    return tuple(groups)
+
+
+def apply_groups(data, groups):
+    # Same result as apply_paths() on the ungrouped items, one dict.update
+    # per run instead of one store per leaf. Returns whether anything changed.
+    changed = False
+    for parent, leaves in groups:
+        cur = data
+        for key in parent:
+            nxt = cur.get(key)
+            if not isinstance(nxt, dict):
+                nxt = cur[key] = {}
+                changed = True
+            cur = nxt
+        # Subset test on the items views runs in C and needs no hashing of values
+        if not leaves.items() <= cur.items():
+            cur.update(leaves)
+            changed = True
+    return changed
@@ -0,0 +1,50 @@
+# Filters, price calculator and blog keys for the KA locale, as
+# (path, value) leaves ready for _merge.apply_paths()
+BLOG_PATCH_PATHS = (
+    (("common", "quads"), "კვადროციკლები"),
+    (("common", "fwd"), "წინა წამყვანი"),
+    (("common", "rwd"), "უკანა წამყვანი"),
+    (("common", "awd"), "4x4 / AWD"),
+    (("common", "reset"), "განულება"),
+    (("common", "show_results"), "შედეგების ნახვა"),
+    (("common", "verified"), "ვერიფიცირებული"),
+    (("home", "price_calculator", "widget_title"), "იმპორტის კალკულატორი"),
+    (("home", "price_calculator", "auction_price"), "აუქციონის ფასი"),
+    (("home", "price_calculator", "engine_volume"), "ძრავის მოცულობა (ლ)"),
+    (("home", "price_calculator", "shipping_poti"), "ტრანსპორტირება ფოთამდე"),
+    (("home", "price_calculator", "est_customs"), "სავარაუდო განბაჟება"),
+    (("home", "price_calculator", "broker_fees"), "ბროკერის & პორტის მოსაკრებელი"),
+    (("home", "price_calculator", "total_estimated"), "სავარაუდო ჯამური ღირებულება"),
+    (("home", "blog", "title"), "ბლოგი"),
+    (("home", "blog", "description"), "ისტორიები და რჩევები ავტომობილების იმპორტზე."),
+    (("home", "blog", "read_time"), "{{minutes}} წთ საკითხავი"),
+    (("home", "blog", "views"), "{{count}} ნახვა"),
+    (("home", "blog", "read_article"), "სტატიის წაკითხვა"),
+    (("home", "blog", "overlay_message"), "ბლოგი სატესტო რეჟიმშია. სტატიები მალე დაემატება."),
+    (("home", "blog", "takeaways_title"), "მთავარი დასკვნები"),
+    (("home", "blog", "categories", "customs"), "განბაჟება"),
+    (("home", "blog", "categories", "auctions"), "აუქციონები"),
+    (("home", "blog", "categories", "tips"), "რჩევები"),
+    (("home", "blog", "empty", "title"), "სტატიები ჯერ არ არის"),
+    (("home", "blog", "empty", "description"), "ვამზადებთ სასარგებლო მასალებს. შეამოწმეთ მოგვიანებით."),
+    (("home", "blog", "empty", "view_catalog_btn"), "კატალოგის ნახვა"),
+    (("home", "blog", "posts", "blog", "post1", "tag"), "გიდები"),
+    (("home", "blog", "posts", "blog", "post1", "title"), "როგორ შევარჩიოთ მანქანა აუქციონზე?"),
+    (("home", "blog", "posts", "blog", "post1", "description"), "მთავარი შემოწმებები და შეცდომების თავიდან არიდება."),
+    (("home", "blog", "posts", "blog", "post1", "takeaways", "1"), "შეამოწმეთ VIN ისტორია"),
+    (("home", "blog", "posts", "blog", "post1", "takeaways", "2"), "შეამოწმეთ ძარის საღებავი"),
+    (("home", "blog", "posts", "blog", "post1", "takeaways", "3"), "შეამოწმეთ ძრავის ხმა"),
+    (("home", "blog", "posts", "blog", "post2", "tag"), "დოკუმენტები"),
+    (("home", "blog", "posts", "blog", "post2", "title"), "რა არის მნიშვნელოვანი ხელშეკრულებაში?"),
+    (("home", "blog", "posts", "blog", "post2", "description"), "იმპორტის ხელშეკრულების მთავარი პუნქტები."),
+    (("home", "blog", "posts", "blog", "post2", "takeaways", "1"), "გადახედეთ ტრანსპორტირების პირობებს"),
+    (("home", "blog", "posts", "blog", "post2", "takeaways", "2"), "შეამოწმეთ დაზღვევა"),
+    (("home", "blog", "posts", "blog", "post2", "takeaways", "3"), "დააზუსტეთ ფარული ხარჯები"),
+    (("home", "blog", "posts", "blog", "post3", "tag"), "დაზოგვა"),
+    (("home", "blog", "posts", "blog", "post3", "title"), "როგორ დავზოგოთ იმპორტზე"),
+    (("home", "blog", "posts", "blog", "post3", "description"), "სტრატეგიები ხარჯების შესამცირებლად რისკის გარეშე."),
+    (("home", "blog", "posts", "blog", "post3", "takeaways", "1"), "გამოთვალეთ განბაჟება"),
+    (("home", "blog", "posts", "blog", "post3", "takeaways", "2"), "შეადარეთ გზები"),
+    (("home", "blog", "posts", "blog", "post3", "takeaways", "3"), "დაჯავშნეთ წინასწარ"),
+    (("auction", "more_filters"), "დამატებითი ფილტრები"),
+)
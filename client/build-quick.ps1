@@ -13,6 +13,14 @@ if ($LASTEXITCODE -ne 0) {
     exit 1
 }
 
+# Compact the locale JSON copied into dist; the sources stay indented
+python ..\minify_locales.py
+
+if ($LASTEXITCODE -ne 0) {
+    Write-Host "❌ Locale minification failed!" -ForegroundColor Red
+    exit 1
+}
+
 Write-Host "✅ Build complete!" -ForegroundColor Green
 Write-Host ""
 Write-Host "📦 Build output is in: client/dist" -ForegroundColor Yellow
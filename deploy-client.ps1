@@ -18,6 +18,14 @@ Write-Host "✅ Client built successfully!" -ForegroundColor Green
 # Navigate back to root
 Set-Location -Path ".."
 
+Write-Host "🗜️ Minifying built locale files..." -ForegroundColor Cyan
+python minify_locales.py
+
+if ($LASTEXITCODE -ne 0) {
+    Write-Host "❌ Locale minification failed!" -ForegroundColor Red
+    exit 1
+}
+
 Write-Host "📦 Deploying to server/public..." -ForegroundColor Cyan
 
 # Remove old files from public folder (except .gitkeep if exists)
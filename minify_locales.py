@@ -0,0 +1,23 @@
+import glob
+import os
+import sys
+
+from _jsonio import dumps_compact, read_json, write_bytes
+
+# Vite copies client/public into client/dist on build, so only the built
+# copies are minified; the git-tracked sources stay indented for diffs.
+# Run by deploy-client.ps1 and client/build-quick.ps1 right after the build,
+# so the path is resolved from this file rather than the working directory.
+DIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "client", "dist", "locales")
+
+def minify_locales():
+    file_paths = sorted(glob.glob(os.path.join(DIST_PATH, "*", "translation.json")))
+    if not file_paths:
+        sys.exit(f"No translation.json found under {DIST_PATH}; run the client build first")
+    for file_path in file_paths:
+        before = os.path.getsize(file_path)
+        write_bytes(file_path, dumps_compact(read_json(file_path)))
+        print(f"Minified {file_path}: {before} -> {os.path.getsize(file_path)} bytes")
+
+if __name__ == "__main__":
+    minify_locales()
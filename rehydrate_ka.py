@@ -2,12 +2,46 @@ import json
 import re
 import os
 
+from _jsonio import load_locale, loads, write_json
+from _merge import apply_paths
+from _patches import BLOG_PATCH_PATHS
+
+# Regex to find "key": "value"
+# Supports escaped quotes in key and value (unrolled loops, no possessive
+# quantifiers, so it compiles before Python 3.11). A key must open right
+# after '{', ',' or whitespace: otherwise every quote inside an escaped \"
+# run would start a new key match that scans to the end of the buffer,
+# which is quadratic on an unterminated string.
+_KV_RE = re.compile(r'(?<=[{,\s])"([^"\\]*(?:\\.[^"\\]*)*)"\s*:\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
+# Trailing commas before a closing brace or bracket, in one pass
+_TRAIL_COMMA = re.compile(r',(?=\s*[}\]])')
+
+def brace_delta(s):
+    # Count of '{' minus '}' outside of string literals, in one pass
+    depth = 0
+    in_str = False
+    esc = False
+    for ch in s:
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == '\\':
+                esc = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+    return depth
+
 ka_path = r'c:\Users\User\Desktop\GITHUB\PROJECTX\client\public\locales\ka\translation.json'
 en_path = r'c:\Users\User\Desktop\GITHUB\PROJECTX\client\public\locales\en\translation.json'
 
 # 1. Load EN structure
-with open(en_path, 'r', encoding='utf-8') as f:
-    en_data = json.load(f)
+en_data = load_locale(en_path)
 
 # 2. Read KA content as text to scrape translations
 with open(ka_path, 'r', encoding='utf-8') as f:
@@ -22,7 +56,6 @@ with open(ka_path, 'r', encoding='utf-8') as f:
 # Or, since I know the file has valid parts, maybe I can just fix the end.
 
 # Let's try to fix the end first.
-lines = ka_content.splitlines()
 # It seems the file ends with:
 #   "error": {
 #     "failed_to_load_data": "..."
@@ -33,69 +66,13 @@ lines = ka_content.splitlines()
 # Actually, the duplicate key error suggests it IS parsing until it hits the syntax error.
 # I will try to use `demjson` if available? No.
 
-# Let's go with the Rehydration strategy, but be careful about context.
-# Use a flat map of "key": "value" from KA. If a key is unique in EN, we map it safely.
-# If not unique (like "title", "description"), we might map it wrong or keep EN.
-# But "title": "ბლოგი" is better than "title": "Blog".
-
-translation_map = {}
-# Regex to find "key": "value"
-# Supports escaped quotes in value
-pattern = re.compile(r'"([^"]+)":\s*"([^"\\]*(?:\\.[^"\\]*)*)"')
-for match in pattern.finditer(ka_content):
-    k, v = match.groups()
-    # Store in list to handle duplicates? No, store last seen (likely most recent edit)
-    translation_map[k] = v
-
-# 4. Walk EN data and fill from translation_map
-def translate_structure(node):
-    if isinstance(node, dict):
-        new_node = {}
-        for k, v in node.items():
-            new_node[k] = translate_structure(v)
-        return new_node
-    elif isinstance(node, str):
-        # Try to find translation
-        # If we have a translation for this key in our map, use it.
-        # Issue: 'title' is ambiguous.
-        # But we can try to use the value from map if it looks Georgian (contains georgian chars).
-        # Regex for Georgian range: \u10A0-\u10FF
-        
-        # Heuristic:
-        # 1. If keys matches and we have it in map.
-        # 2. Check if map value is different from EN value (to avoid overwriting with English if map has English)
-        # 3. Prefer Georgian value.
-        
-        # Actually, since I am fixing the file, I should just use what I found in KA file.
-        # But the KA file has duplicates.
-        
-        # What if I simply try to load the KA file ignoring errors?
-        # No suitable lib.
-        
-        # Let's stick to the known new translations I wanted to add. 
-        # For the rest, I will keep EN if I can't safely map.
-        # BUT the user already had translations! I must not lose them.
-        
-        # Better Idea: The syntax error is likely just at the end.
-        # I will try to find the index of the syntax error and truncate there, then add closing braces.
-        pass
-        
-        # Let's assume 'node' is the English text.
-        # We want to find if we have a Georgian text for this key.
-        # Since 'translation_map' is flat, 'title' will be overwritten multiple times.
-        # This approach is flawed for common keys.
-        
-        return node
-
 # New Strategy:
 # Read lines of KA file.
 # Build a valid JSON string by validating partial stack? Too complex.
 
 # Let's try to fix the closing braces count.
-# Count { and }
-open_braces = ka_content.count('{')
-close_braces = ka_content.count('}')
-diff = open_braces - close_braces
+# Count { and } (braces inside Georgian values must not be counted)
+diff = brace_delta(ka_content)
 
 if diff > 0:
     # Append missing braces
@@ -108,21 +85,31 @@ else:
 
 # Try to load fixed content
 try:
-    ka_data = json.loads(fixed_content)
+    ka_data = loads(fixed_content)
 except json.JSONDecodeError:
     # Still duplicate keys might be issue? strict=False in standard lib doesn't allow duplicates?
     # Standard json allows duplicates, it just uses the last one.
     # So syntax error is something else.
     # Maybe trailing comma?
-    # Regex to remove trailing commas: ,(?=\s*})
-    fixed_content = re.sub(r',(?=\s*})', '', fixed_content)
-    fixed_content = re.sub(r',(?=\s*])', '', fixed_content)
+    # Regex to remove trailing commas: ,(?=\s*[}\]])
+    fixed_content = _TRAIL_COMMA.sub('', fixed_content)
     
     try:
-        ka_data = json.loads(fixed_content)
+        ka_data = loads(fixed_content)
     except:
         print("Still failed. Using EN data as fallback and merging known manual translations.")
         ka_data = en_data # Start with EN structure (all english)
+
+        # Only scrape the broken text when it can't be parsed at all.
+        # Let's go with the Rehydration strategy, but be careful about context.
+        # Use a flat map of "key": "value" from KA. If a key is unique in EN, we map it safely.
+        # If not unique (like "title", "description"), we might map it wrong or keep EN.
+        # But "title": "ბლოგი" is better than "title": "Blog".
+
+        # One scan, pairs collected in C; dict() keeps the last seen value
+        # for duplicate keys (likely the most recent edit)
+        translation_map = dict(_KV_RE.findall(ka_content))
+
         # We will lose existing KA translations if we do this!! 
         # DO NOT SAVE if this happens, unless we accept partial data.
         # But I have the manual translations I wanted to add.
@@ -138,98 +125,9 @@ if 'ka_data' not in locals():
     ka_data = en_data # Fallback
 
 # Apply the new translations I prepared
-new_translations = {
-    "common": {
-        "quads": "კვადროციკლები",
-        "fwd": "წინა წამყვანი",
-        "rwd": "უკანა წამყვანი",
-        "awd": "4x4 / AWD",
-        "reset": "განულება",
-        "show_results": "შედეგების ნახვა",
-        "verified": "ვერიფიცირებული"
-    },
-    "home": {
-        "price_calculator": {
-            "widget_title": "იმპორტის კალკულატორი",
-            "auction_price": "აუქციონის ფასი",
-            "engine_volume": "ძრავის მოცულობა (ლ)",
-            "shipping_poti": "ტრანსპორტირება ფოთამდე",
-            "est_customs": "სავარაუდო განბაჟება",
-            "broker_fees": "ბროკერის & პორტის მოსაკრებელი",
-            "total_estimated": "სავარაუდო ჯამური ღირებულება"
-        },
-        "blog": {
-            "title": "ბლოგი",
-            "description": "ისტორიები და რჩევები ავტომობილების იმპორტზე.",
-            "read_time": "{{minutes}} წთ საკითხავი",
-            "views": "{{count}} ნახვა",
-            "read_article": "სტატიის წაკითხვა",
-            "overlay_message": "ბლოგი სატესტო რეჟიმშია. სტატიები მალე დაემატება.",
-            "takeaways_title": "მთავარი დასკვნები",
-            "categories": {
-                "customs": "განბაჟება",
-                "auctions": "აუქციონები",
-                "tips": "რჩევები"
-            },
-            "empty": {
-                "title": "სტატიები ჯერ არ არის",
-                "description": "ვამზადებთ სასარგებლო მასალებს. შეამოწმეთ მოგვიანებით.",
-                "view_catalog_btn": "კატალოგის ნახვა"
-            },
-            "posts": {
-                "blog": {
-                    "post1": {
-                        "tag": "გიდები",
-                        "title": "როგორ შევარჩიოთ მანქანა აუქციონზე?",
-                        "description": "მთავარი შემოწმებები და შეცდომების თავიდან არიდება.",
-                        "takeaways": {
-                            "1": "შეამოწმეთ VIN ისტორია",
-                            "2": "შეამოწმეთ ძარის საღებავი",
-                            "3": "შეამოწმეთ ძრავის ხმა"
-                        }
-                    },
-                    "post2": {
-                        "tag": "დოკუმენტები",
-                        "title": "რა არის მნიშვნელოვანი ხელშეკრულებაში?",
-                        "description": "იმპორტის ხელშეკრულების მთავარი პუნქტები.",
-                        "takeaways": {
-                            "1": "გადახედეთ ტრანსპორტირების პირობებს",
-                            "2": "შეამოწმეთ დაზღვევა",
-                            "3": "დააზუსტეთ ფარული ხარჯები"
-                        }
-                    },
-                    "post3": {
-                        "tag": "დაზოგვა",
-                        "title": "როგორ დავზოგოთ იმპორტზე",
-                        "description": "სტრატეგიები ხარჯების შესამცირებლად რისკის გარეშე.",
-                        "takeaways": {
-                            "1": "გამოთვალეთ განბაჟება",
-                            "2": "შეადარეთ გზები",
-                            "3": "დაჯავშნეთ წინასწარ"
-                        }
-                    }
-                }
-            }
-        }
-    },
-    "auction": {
-        "more_filters": "დამატებითი ფილტრები"
-    }
-}
-
-# Helper to merge
-def deep_update(d, u):
-    for k, v in u.items():
-        if isinstance(v, dict):
-            d[k] = deep_update(d.get(k, {}), v)
-        else:
-            d[k] = v
-    return d
-
-deep_update(ka_data, new_translations)
+apply_paths(ka_data, BLOG_PATCH_PATHS)
 
 # Save
-with open(ka_path, 'w', encoding='utf-8') as f:
-    json.dump(ka_data, f, ensure_ascii=False, indent=2)
+write_json(ka_path, ka_data)
 
 print("Rehydrated ka/translation.json")
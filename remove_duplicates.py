@@ -1,23 +1,39 @@
 import json
 import os
 
+from _jsonio import write_json
+
 def remove_duplicates():
     file_path = r"c:\Users\User\Desktop\GITHUB\PROJECTX\client\public\locales\en\translation.json"
-    
+
+    found_duplicates = False
+
+    def dedupe(pairs):
+        # Same last-occurrence-wins result as a plain load, but remember if
+        # any object actually had a repeated key
+        nonlocal found_duplicates
+        data = dict(pairs)
+        if len(data) != len(pairs):
+            found_duplicates = True
+        return data
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            # Loading into a dictionary automatically removes duplicates
-            # Python's json parser will keep the last occurrence of a key
-            data = json.load(f)
-        
+        # Loading into a dictionary automatically removes duplicates
+        # Python's json parser will keep the last occurrence of a key
+        with open(file_path, 'rb') as f:
+            data = json.loads(f.read(), object_pairs_hook=dedupe)
+
+        if not found_duplicates:
+            print(f"No duplicates found in {file_path}")
+            return
+
         # Write back the clean JSON
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            
+        write_json(file_path, data)
+
         print(f"Successfully cleaned duplicates in {file_path}")
-        
+
     except json.JSONDecodeError as e:
         print(f"JSON Error: {e}")
-        
+
 if __name__ == "__main__":
     remove_duplicates()
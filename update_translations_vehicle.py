@@ -1,345 +1,319 @@
-import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from _jsonio import dumps, loads, write_bytes
+from _merge import apply_groups, group_paths
+
+BASE_PATH = "client/public/locales"
+
+# Text for every translation path, keyed by dotted path. "en" lists the
+# paths in the order new keys are inserted; every other language must
+# cover exactly the same paths.
+VALUES = {
+    "en": {
+        "vehicle_details.errors.not_found": "Vehicle identifier not found.",
+        "vehicle_details.errors.fill_name_phone": "Please fill in name and phone number.",
+        "vehicle_details.errors.phone_min_length": "Phone number must be at least 3 characters.",
+        "vehicle_details.errors.select_min_one_company": "Select at least one company for the request.",
+        "vehicle_details.errors.company_id_failed": "Failed to identify selected companies.",
+        "vehicle_details.errors.request_failed": "Failed to send request. Please try again.",
+        "vehicle_details.support_modal.aria_label": "Choose more companies for support",
+        "vehicle_details.support_modal.close_aria": "Close support window",
+        "vehicle_details.support_modal.title": "Unlock choice up to 5 companies",
+        "vehicle_details.support_modal.description": "Like our project on social networks and write a short review to send a request to multiple companies at once.",
+        "vehicle_details.support_modal.liked_project": "I liked the project on social networks",
+        "vehicle_details.support_modal.ready_to_review": "I am ready to share a short review",
+        "vehicle_details.support_modal.your_review_label": "Your short review",
+        "vehicle_details.support_modal.unlock_btn": "Unlock choice up to 5 companies",
+        "vehicle_details.request_modal.aria_label": "Common request to multiple companies",
+        "vehicle_details.request_modal.close_aria": "Close common request window",
+        "vehicle_details.request_modal.title": "Common request to multiple companies",
+        "vehicle_details.request_modal.selected_companies": "Selected companies: {{names}}",
+        "vehicle_details.request_modal.comment_label": "Comment / Additional wishes",
+        "vehicle_details.request_modal.min_budget": "Min. Budget (USD)",
+        "vehicle_details.request_modal.max_budget": "Max. Budget (USD)",
+        "vehicle_details.request_modal.desired_time": "Desired Time (Days)",
+        "vehicle_details.request_modal.max_time": "Max. Accepted Time (Days)",
+        "vehicle_details.request_modal.damage_tolerance.title": "Damage Tolerance",
+        "vehicle_details.request_modal.damage_tolerance.minimal": "Minimal",
+        "vehicle_details.request_modal.damage_tolerance.average": "Average",
+        "vehicle_details.request_modal.damage_tolerance.any": "Any",
+        "vehicle_details.request_modal.additional_services.title": "Additional Services",
+        "vehicle_details.request_modal.additional_services.full_documents": "Full Documents",
+        "vehicle_details.request_modal.additional_services.door_delivery": "Door Delivery",
+        "vehicle_details.request_modal.additional_services.customs_support": "Customs Support",
+        "vehicle_details.request_modal.contact_channel.title": "Preferred Contact Channel",
+        "vehicle_details.request_modal.contact_channel.call": "Call",
+        "vehicle_details.request_modal.priority": "Priority",
+        "vehicle_details.request_modal.send_btn": "Send",
+        "vehicle_details.request_modal.send_request_btn": "Send Request",
+        "vehicle_details.gallery.zoom_aria": "Zoom main photo to full screen",
+        "vehicle_details.gallery.prev_aria": "Previous photos",
+        "vehicle_details.gallery.select_zoom_aria": "Select this photo to zoom",
+        "vehicle_details.gallery.next_aria": "Next photos",
+        "vehicle_details.gallery.unavailable": "Photos unavailable",
+        "vehicle_details.info.basic_data": "Basic Data",
+        "vehicle_details.info.engine_transmission": "Engine / Transmission",
+        "vehicle_details.info.color_condition": "Color / Condition",
+        "vehicle_details.info.damages": "Damages",
+        "vehicle_details.info.keys_run_drive": "Keys / Run & Drive",
+        "vehicle_details.info.cylinders_equipment": "Cylinders / Equipment",
+        "vehicle_details.info.docs_auction": "Documents and Auction",
+        "vehicle_details.info.yard_location": "Auction Yard / Location",
+        "vehicle_details.info.market_repair_value": "Market / Repair Value",
+        "vehicle_details.info.calculated_price": "Calculated Price",
+        "vehicle_details.info.seller": "Seller",
+        "vehicle_details.info.title_doc": "TITLE / Document",
+        "vehicle_details.info.sale_date": "Sale Date",
+        "vehicle_details.info.created_updated": "Created / Updated",
+        "vehicle_details.info.api_fields": "Additional API Fields (Helper Info)",
+        "vehicle_details.offers.title": "Company offers for this vehicle",
+        "vehicle_details.offers.recalculating": "Recalculating...",
+        "vehicle_details.offers.recalculate": "Recalculate",
+        "vehicle_details.offers.compare_text": "Compare total import price and delivery time from various trusted companies from USA to Georgia.",
+        "vehicle_details.offers.distance_to_poti": "Distance to Poti",
+        "vehicle_details.offers.total_price_disclaimer": "Total price includes vehicle price, transportation, service and broker fees, customs and other fees are approximate.",
+        "vehicle_details.offers.no_offers": "No vehicle import offers found at this stage. Try recalculating or returning later, or find another vehicle for import.",
+        "vehicle_details.offers.back_to_catalog": "Back to Catalog",
+        "vehicle_details.offers.find_other": "Find other vehicle",
+        "vehicle_details.offers.best_shipping": "Best Shipping Price",
+        "vehicle_details.offers.shipping_desc": "Transportation from USA to Georgia port (other services calculated separately)",
+        "vehicle_details.offers.company_filter": "Company Filter",
+        "vehicle_details.offers.fast_delivery": "Fast Delivery",
+        "vehicle_details.offers.list_aria": "List of company offers",
+        "vehicle_details.offers.premium_vip": "Premium / VIP Offers",
+        "vehicle_details.offers.standard": "Standard Offers - Lower Price",
+        "vehicle_details.offers.discount": "Discount",
+        "vehicle_details.offers.approx_savings": "Approx. Savings",
+        "vehicle_details.offers.individual_calc": "Individual Calculation",
+        "vehicle_details.offers.discount_disclaimer": "Discount is relevant for current calculation and may change.",
+        "vehicle_details.offers.trusted_partner": "Trusted Partner",
+        "vehicle_details.offers.trusted_partner_desc": "Trusted Partner — selected importer based on our internal evaluation and user reviews.",
+        "vehicle_details.offers.secure_payment": "Secure Payment",
+        "vehicle_details.offers.secure_payment_desc": "Secure Payment — amount is fixed via trusted channel until importer confirms service.",
+        "vehicle_details.offers.documents_full": "Full Documents",
+        "vehicle_details.offers.documents_full_desc": "Full Documents — importer provides all necessary import and registration documents.",
+        "vehicle_details.offers.documents": "Documents",
+        "vehicle_details.offers.transport": "Transport",
+        "vehicle_details.offers.customs": "Customs",
+        "vehicle_details.offers.select_fee_aria": "Select fee for this company offer",
+        "vehicle_details.offers.select_offer_aria": "Select this offer or deselect",
+        "vehicle_details.offers.add_to_common_aria": "Add to common request for this company",
+        "vehicle_details.offers.selected": "Selected",
+        "vehicle_details.offers.selected_common": "Selected for common request",
+        "vehicle_details.offers.select": "Select",
+        "vehicle_details.offers.recent_imports": "Recent successful import examples",
+        "vehicle_details.offers.import_completed_in": "Import completed in {{days}} days",
+        "vehicle_details.offers.see_other_auctions": "See other active auctions",
+        "vehicle_details.offers.not_found_msg": "Vehicle not found. Try again or return to search.",
+        "vehicle_details.offers.continue_working": "Continue working with offers",
+        "vehicle_details.offers.compare_desc": "Compare companies, choose best and return to catalog to see new vehicle.",
+        "vehicle_details.offers.back_to_catalog_aria": "Return to company catalog",
+        "vehicle_details.offers.go_to_offers_aria": "Go to company offers section",
+        "vehicle_details.offers.see_offers": "See Offers",
+        "vehicle_details.offers.send_request_aria": "Send request to selected companies",
+        "vehicle_details.checkout.aria_label": "Checkout - {{company}}",
+        "vehicle_details.checkout.close_aria": "Close checkout window",
+        "vehicle_details.checkout.title": "Checkout",
+        "vehicle_details.checkout.total_import_price": "Total Import Price",
+        "vehicle_details.checkout.send_application": "Send Application",
+        "vehicle_details.checkout.received_aria": "Application Received - {{company}}",
+        "vehicle_details.checkout.close_confirmation_aria": "Close confirmation window",
+        "vehicle_details.checkout.received_title": "Application Received",
+        "vehicle_details.checkout.received_desc": "We will transfer your application to the importer and they will contact you on the next business day.",
+        "vehicle_details.checkout.contact_importer": "Contact Importer",
+        "vehicle_details.checkout.go_to_company": "Go to Company Page",
+        "vehicle_details.checkout.detailed_price_aria": "Detailed Price - {{company}}",
+        "vehicle_details.checkout.close_price_check_aria": "Close price check",
+        "vehicle_details.checkout.fullscreen_photo_aria": "Fullscreen photo view",
+        "vehicle_details.checkout.close": "Close",
+        "common.name": "Name",
+        "common.phone": "Phone",
+        "common.any": "Any",
+        "common.close": "Close",
+        "common.reviews": "reviews",
+        "common.price": "Price",
+    },
+    "ka": {
+        "vehicle_details.errors.not_found": "ავტომობილის იდენტიფიკატორი ვერ მოიძებნა.",
+        "vehicle_details.errors.fill_name_phone": "გთხოვთ შეავსოთ სახელი და ტელეფონის ნომერი.",
+        "vehicle_details.errors.phone_min_length": "ტელეფონის ნომერი უნდა შეიცავდეს მინიმუმ 3 სიმბოლოს.",
+        "vehicle_details.errors.select_min_one_company": "აირჩიეთ მინიმუმ ერთი კომპანია საერთო მოთხოვნისთვის.",
+        "vehicle_details.errors.company_id_failed": "ვერ მოხერხდა არჩეული კომპანიების იდენტიფიკაცია.",
+        "vehicle_details.errors.request_failed": "ვერ მოხერხდა მოთხოვნის გაგზავნა. სცადეთ კიდევ ერთხელ.",
+        "vehicle_details.support_modal.aria_label": "აირჩიე მეტი კომპანია მხარდაჭერისთვის",
+        "vehicle_details.support_modal.close_aria": "დახურე მხარდაჭერის ფანჯარა",
+        "vehicle_details.support_modal.title": "გახსენი არჩევანი 5 კომპანიამდე",
+        "vehicle_details.support_modal.description": "დაალაიქე ჩვენი პროექტი სოციალურ ქსელებში და დაწერე მოკლე შეფასება, რათა ერთდროულად რამდენიმე კომპანიას გაუგზავნო მოთხოვნა.",
+        "vehicle_details.support_modal.liked_project": "მე დავუჭირე მხარი პროექტს სოციალურ ქსელებში",
+        "vehicle_details.support_modal.ready_to_review": "მზად ვარ გავუზიარო მოკლე შეფასება",
+        "vehicle_details.support_modal.your_review_label": "შენი მოკლე შეფასება",
+        "vehicle_details.support_modal.unlock_btn": "გახსენი არჩევანი 5 კომპანიამდე",
+        "vehicle_details.request_modal.aria_label": "საერთო მოთხოვნა რამდენიმე კომპანიაზე",
+        "vehicle_details.request_modal.close_aria": "დახურე საერთო მოთხოვნის ფანჯარა",
+        "vehicle_details.request_modal.title": "საერთო მოთხოვნა რამდენიმე კომპანიაზე",
+        "vehicle_details.request_modal.selected_companies": "არჩეული კომპანიები: {{names}}",
+        "vehicle_details.request_modal.comment_label": "კომენტარი / დამატებითი სურვილები",
+        "vehicle_details.request_modal.min_budget": "მინ. ბიუჯეტი (USD)",
+        "vehicle_details.request_modal.max_budget": "მაქს. ბიუჯეტი (USD)",
+        "vehicle_details.request_modal.desired_time": "სასურველი ვადა (დღე)",
+        "vehicle_details.request_modal.max_time": "მაქს. მისაღები ვადა (დღე)",
+        "vehicle_details.request_modal.damage_tolerance.title": "ზიანის tolerate-იანობა",
+        "vehicle_details.request_modal.damage_tolerance.minimal": "მინიმალური",
+        "vehicle_details.request_modal.damage_tolerance.average": "საშუალო",
+        "vehicle_details.request_modal.damage_tolerance.any": "ნებისმიერი",
+        "vehicle_details.request_modal.additional_services.title": "დამატებითი სერვისები",
+        "vehicle_details.request_modal.additional_services.full_documents": "სრული დოკუმენტები",
+        "vehicle_details.request_modal.additional_services.door_delivery": "მიწოდება მისამართზე",
+        "vehicle_details.request_modal.additional_services.customs_support": "საბაჟო მხარდაჭერა",
+        "vehicle_details.request_modal.contact_channel.title": "სასურველი საკონტაქტო არხი",
+        "vehicle_details.request_modal.contact_channel.call": "ზარი",
+        "vehicle_details.request_modal.priority": "პრიორიტეტი",
+        "vehicle_details.request_modal.send_btn": "გაგზავნა",
+        "vehicle_details.request_modal.send_request_btn": "გაგზავნა მოთხოვნა",
+        "vehicle_details.gallery.zoom_aria": "გაადიდე მთავარი ფოტო სრულ ეკრანზე",
+        "vehicle_details.gallery.prev_aria": "წინა ფოტოები",
+        "vehicle_details.gallery.select_zoom_aria": "აირჩიე ეს ფოტო გასადიდებლად",
+        "vehicle_details.gallery.next_aria": "შემდეგი ფოტოები",
+        "vehicle_details.gallery.unavailable": "ფოტოები მიუწვდომელია",
+        "vehicle_details.info.basic_data": "ძირითადი მონაცემები",
+        "vehicle_details.info.engine_transmission": "ძრავი / ტრანსმისია",
+        "vehicle_details.info.color_condition": "ფერი / მდგომარეობა",
+        "vehicle_details.info.damages": "დაზიანებები",
+        "vehicle_details.info.keys_run_drive": "გასაღებები / Run & Drive",
+        "vehicle_details.info.cylinders_equipment": "ცილინდრები / აღჭურვილობა",
+        "vehicle_details.info.docs_auction": "დოკუმენტები და აუქციონი",
+        "vehicle_details.info.yard_location": "აუქციონის ეზო / მდებარეობა",
+        "vehicle_details.info.market_repair_value": "საბაზრო / შეკეთების ღირებულება",
+        "vehicle_details.info.calculated_price": "გამოთვლილი ფასი",
+        "vehicle_details.info.seller": "გამყიდველი",
+        "vehicle_details.info.title_doc": "TITLE / დოკუმენტი",
+        "vehicle_details.info.sale_date": "გაყიდვის თარიღი",
+        "vehicle_details.info.created_updated": "შექმნა / განახლება",
+        "vehicle_details.info.api_fields": "დამატებითი API ველები (დამხმარე ინფორმაცია)",
+        "vehicle_details.offers.title": "კომპანიების შეთავაზებები ამ ავტომობილზე",
+        "vehicle_details.offers.recalculating": "გადათვლა...",
+        "vehicle_details.offers.recalculate": "გადათვლა",
+        "vehicle_details.offers.compare_text": "შეადარე იმპორტის სრული ფასი და მიწოდების დრო სხვადასხვა სანდო კომპანიისგან აშშ-დან საქართველოში.",
+        "vehicle_details.offers.distance_to_poti": "დისტანცია ფოთამდე",
+        "vehicle_details.offers.total_price_disclaimer": "სრული ფასი მოიცავს ფასი მანქანის, ტრანსპორტირებას, მომსახურებისა და საბროკერო საფასურს, საბაჟო და სხვა გადასახადები წარმოდგენილია დაახლოებით.",
+        "vehicle_details.offers.no_offers": "ამ ეტაპზე ავტომობილის იმპორტის შეთავაზებები არ არის ნაპოვნი. სცადეთ გადათვლა ან მოგვიანებით დაბრუნება, ან მოიძიეთ სხვა ავტომობილი იმპორტისთვის.",
+        "vehicle_details.offers.back_to_catalog": "კატალოგში დაბრუნება",
+        "vehicle_details.offers.find_other": "მოძებნე სხვა ავტომობილი",
+        "vehicle_details.offers.best_shipping": "საუკეთესო ტრანსპორტირების ფასი",
+        "vehicle_details.offers.shipping_desc": "ტრანსპორტირება აშშ-დან საქართველოს პორტამდე (სხვა მომსახურება ცალკე ითვლება)",
+        "vehicle_details.offers.company_filter": "კომპანიების ფილტრი",
+        "vehicle_details.offers.fast_delivery": "სწრაფი მიწოდება",
+        "vehicle_details.offers.list_aria": "კომპანიების შეთავაზებების სია",
+        "vehicle_details.offers.premium_vip": "Premium / VIP შეთავაზებები",
+        "vehicle_details.offers.standard": "სტანდარტული შეთავაზებები — უფრო დაბალი ფასით",
+        "vehicle_details.offers.discount": "ფასდაკლება",
+        "vehicle_details.offers.approx_savings": "დაახლოებითი ეკონომია",
+        "vehicle_details.offers.individual_calc": "ინდივიდუალური გათვლა",
+        "vehicle_details.offers.discount_disclaimer": "ფასდაკლება აქტუალურია მიმდინარე კალკულაციისთვის და შეიძლება შეიცვალოს.",
+        "vehicle_details.offers.trusted_partner": "სანდო პარტნიორი",
+        "vehicle_details.offers.trusted_partner_desc": "სანდო პარტნიორი — ჩვენი შიდა შეფასებით და მომხმარებელთა გამოხმაურებებით შერჩეული იმპორტერი.",
+        "vehicle_details.offers.secure_payment": "დაცული გადახდა",
+        "vehicle_details.offers.secure_payment_desc": "დაცული გადახდა — თანხა იფიქსირება სანდო არხით, სანამ იმპორტერი არ დაადასტურებს მომსახურებას.",
+        "vehicle_details.offers.documents_full": "დოკუმენტები სრულად",
+        "vehicle_details.offers.documents_full_desc": "დოკუმენტები სრულად — იმპორტერი უზრუნველყოფს ყველა საჭირო იმპორტის და რეგისტრაციის დოკუმენტის მომზადებას.",
+        "vehicle_details.offers.documents": "დოკუმენტები",
+        "vehicle_details.offers.transport": "ტრანსპორტირება",
+        "vehicle_details.offers.customs": "საბაჟო",
+        "vehicle_details.offers.select_fee_aria": "გამოყავი საფასური ამ კომპანიის შეთავაზებისთვის",
+        "vehicle_details.offers.select_offer_aria": "აირჩიე ეს შეთავაზება ან მოხსენი არჩევანი",
+        "vehicle_details.offers.add_to_common_aria": "დამატება საერთო მოთხოვნაში ამ კომპანიისთვის",
+        "vehicle_details.offers.selected": "არჩეულია",
+        "vehicle_details.offers.selected_common": "არჩეულია საერთო მოთხოვნისთვის",
+        "vehicle_details.offers.select": "არჩევა",
+        "vehicle_details.offers.recent_imports": "ბოლო წარმატებული იმპორტის მაგალითები",
+        "vehicle_details.offers.import_completed_in": "იმპორტი დასრულდა {{days}} დღეში",
+        "vehicle_details.offers.see_other_auctions": "ნახე სხვა აქტიური აუქციონები",
+        "vehicle_details.offers.not_found_msg": "ავტომობილი ვერ მოიძებნა. სცადეთ კიდევ ერთხელ ან დაბრუნდით ძიებაზე.",
+        "vehicle_details.offers.continue_working": "გაგრძელე მუშაობა შეთავაზებებთან",
+        "vehicle_details.offers.compare_desc": "შეადარე კომპანიები, აირჩიე საუკეთესო და დაბრუნდი კატალოგში ახალი ავტომობილის სანახავად.",
+        "vehicle_details.offers.back_to_catalog_aria": "დაბრუნდი კომპანიების კატალოგში",
+        "vehicle_details.offers.go_to_offers_aria": "გადადი კომპანიების შეთავაზებების სექციაზე",
+        "vehicle_details.offers.see_offers": "ნახე შეთავაზებები",
+        "vehicle_details.offers.send_request_aria": "გაგზავნა მოთხოვნის გაგზავნა არჩეული კომპანიებისთვის",
+        "vehicle_details.checkout.aria_label": "შეკვეთის გაფორმება - {{company}}",
+        "vehicle_details.checkout.close_aria": "დახურე შეკვეთის გაფორმების ფანჯარა",
+        "vehicle_details.checkout.title": "შეკვეთის გაფორმება",
+        "vehicle_details.checkout.total_import_price": "სრული ფასი იმპორტზე",
+        "vehicle_details.checkout.send_application": "გაგზავნა განაცხადი",
+        "vehicle_details.checkout.received_aria": "განაცხადი მიღებულია - {{company}}",
+        "vehicle_details.checkout.close_confirmation_aria": "დახურე დადასტურების ფანჯარა",
+        "vehicle_details.checkout.received_title": "განაცხადი მიღებულია",
+        "vehicle_details.checkout.received_desc": "ჩვენ გადავცემთ თქვენს განაცხადს იმპორტერს და ის დაგიკავშირდებათ უახლოეს სამუშაო დღეს.",
+        "vehicle_details.checkout.contact_importer": "დაუკავშირდი იმპორტერს",
+        "vehicle_details.checkout.go_to_company": "გადადი კომპანიის გვერდზე",
+        "vehicle_details.checkout.detailed_price_aria": "დეტალური ფასი იმპორტზე - {{company}}",
+        "vehicle_details.checkout.close_price_check_aria": "დახურე ფასის დეტალური ჩეკი",
+        "vehicle_details.checkout.fullscreen_photo_aria": "ფოტოს სრულეკრანიანი ჩვენება",
+        "vehicle_details.checkout.close": "დახურვა",
+        "common.name": "სახელი",
+        "common.phone": "ტელეფონი",
+        "common.any": "ნებისმიერი",
+        "common.close": "დახურვა",
+        "common.reviews": "შეფასება",
+        "common.price": "ფასი",
+    },
+}
+
+SCHEMA = tuple(VALUES["en"])
+
+for _lang, _values in VALUES.items():
+    if _values.keys() != set(SCHEMA):
+        raise ValueError(f"VALUES[{_lang!r}] does not match SCHEMA: "
+                         f"{sorted(_values.keys() ^ set(SCHEMA))}")
+
+# Split once at import into key tuples, shared by every language
+_PATHS = tuple(tuple(sys.intern(k) for k in path.split(".")) for path in SCHEMA)
+
+# common leaves per language, keyed by their name inside "common"
+COMMON = {
+    lang: {path[1]: values[dotted] for dotted, path in zip(SCHEMA, _PATHS) if path[0] == "common"}
+    for lang, values in VALUES.items()
+}
+
+# Everything else (vehicle_details) as runs of sibling leaves for apply_groups
+PLAN = {
+    lang: group_paths((path, values[dotted]) for dotted, path in zip(SCHEMA, _PATHS) if path[0] != "common")
+    for lang, values in VALUES.items()
+}
+
+def _update_one_lang(lang, file_path):
+    # Returns a status line instead of printing from the worker thread
+    # Keep the raw bytes so an unchanged result can be detected below
+    with open(file_path, 'rb') as f:
+        orig_blob = f.read()
+    data = loads(orig_blob)
+
+    # common is a flat group of leaves, a single dict.update covers it
+    data.setdefault("common", {}).update(COMMON[lang])
+
+    # vehicle_details nests several levels deep, one dict.update per leaf group
+    apply_groups(data, PLAN[lang])
+
+    new_blob = dumps(data)
+    if new_blob == orig_blob:
+        return f"{file_path} already up to date"
+
+    # One os.write of the whole buffer, no buffered file object in between
+    write_bytes(file_path, new_blob)
+    return f"Updated {file_path}"
 
 def update_translations():
-    base_path = "client/public/locales"
     langs = ["en", "ka"]
-    
-    new_keys_en = {
-        "vehicle_details": {
-            "errors": {
-                "not_found": "Vehicle identifier not found.",
-                "fill_name_phone": "Please fill in name and phone number.",
-                "phone_min_length": "Phone number must be at least 3 characters.",
-                "select_min_one_company": "Select at least one company for the request.",
-                "company_id_failed": "Failed to identify selected companies.",
-                "request_failed": "Failed to send request. Please try again."
-            },
-            "support_modal": {
-                "aria_label": "Choose more companies for support",
-                "close_aria": "Close support window",
-                "title": "Unlock choice up to 5 companies",
-                "description": "Like our project on social networks and write a short review to send a request to multiple companies at once.",
-                "liked_project": "I liked the project on social networks",
-                "ready_to_review": "I am ready to share a short review",
-                "your_review_label": "Your short review",
-                "unlock_btn": "Unlock choice up to 5 companies"
-            },
-            "request_modal": {
-                "aria_label": "Common request to multiple companies",
-                "close_aria": "Close common request window",
-                "title": "Common request to multiple companies",
-                "selected_companies": "Selected companies: {{names}}",
-                "comment_label": "Comment / Additional wishes",
-                "min_budget": "Min. Budget (USD)",
-                "max_budget": "Max. Budget (USD)",
-                "desired_time": "Desired Time (Days)",
-                "max_time": "Max. Accepted Time (Days)",
-                "damage_tolerance": {
-                    "title": "Damage Tolerance",
-                    "minimal": "Minimal",
-                    "average": "Average",
-                    "any": "Any"
-                },
-                "additional_services": {
-                    "title": "Additional Services",
-                    "full_documents": "Full Documents",
-                    "door_delivery": "Door Delivery",
-                    "customs_support": "Customs Support"
-                },
-                "contact_channel": {
-                    "title": "Preferred Contact Channel",
-                    "call": "Call"
-                },
-                "priority": "Priority",
-                "send_btn": "Send",
-                "send_request_btn": "Send Request"
-            },
-            "gallery": {
-                "zoom_aria": "Zoom main photo to full screen",
-                "prev_aria": "Previous photos",
-                "select_zoom_aria": "Select this photo to zoom",
-                "next_aria": "Next photos",
-                "unavailable": "Photos unavailable"
-            },
-            "info": {
-                "basic_data": "Basic Data",
-                "engine_transmission": "Engine / Transmission",
-                "color_condition": "Color / Condition",
-                "damages": "Damages",
-                "keys_run_drive": "Keys / Run & Drive",
-                "cylinders_equipment": "Cylinders / Equipment",
-                "docs_auction": "Documents and Auction",
-                "yard_location": "Auction Yard / Location",
-                "market_repair_value": "Market / Repair Value",
-                "calculated_price": "Calculated Price",
-                "seller": "Seller",
-                "title_doc": "TITLE / Document",
-                "sale_date": "Sale Date",
-                "created_updated": "Created / Updated",
-                "api_fields": "Additional API Fields (Helper Info)"
-            },
-            "offers": {
-                "title": "Company offers for this vehicle",
-                "recalculating": "Recalculating...",
-                "recalculate": "Recalculate",
-                "compare_text": "Compare total import price and delivery time from various trusted companies from USA to Georgia.",
-                "distance_to_poti": "Distance to Poti",
-                "total_price_disclaimer": "Total price includes vehicle price, transportation, service and broker fees, customs and other fees are approximate.",
-                "no_offers": "No vehicle import offers found at this stage. Try recalculating or returning later, or find another vehicle for import.",
-                "back_to_catalog": "Back to Catalog",
-                "find_other": "Find other vehicle",
-                "best_shipping": "Best Shipping Price",
-                "shipping_desc": "Transportation from USA to Georgia port (other services calculated separately)",
-                "company_filter": "Company Filter",
-                "fast_delivery": "Fast Delivery",
-                "list_aria": "List of company offers",
-                "premium_vip": "Premium / VIP Offers",
-                "standard": "Standard Offers - Lower Price",
-                "discount": "Discount",
-                "approx_savings": "Approx. Savings",
-                "individual_calc": "Individual Calculation",
-                "discount_disclaimer": "Discount is relevant for current calculation and may change.",
-                "trusted_partner": "Trusted Partner",
-                "trusted_partner_desc": "Trusted Partner — selected importer based on our internal evaluation and user reviews.",
-                "secure_payment": "Secure Payment",
-                "secure_payment_desc": "Secure Payment — amount is fixed via trusted channel until importer confirms service.",
-                "documents_full": "Full Documents",
-                "documents_full_desc": "Full Documents — importer provides all necessary import and registration documents.",
-                "documents": "Documents",
-                "transport": "Transport",
-                "customs": "Customs",
-                "select_fee_aria": "Select fee for this company offer",
-                "select_offer_aria": "Select this offer or deselect",
-                "add_to_common_aria": "Add to common request for this company",
-                "selected": "Selected",
-                "selected_common": "Selected for common request",
-                "select": "Select",
-                "recent_imports": "Recent successful import examples",
-                "import_completed_in": "Import completed in {{days}} days",
-                "see_other_auctions": "See other active auctions",
-                "not_found_msg": "Vehicle not found. Try again or return to search.",
-                "continue_working": "Continue working with offers",
-                "compare_desc": "Compare companies, choose best and return to catalog to see new vehicle.",
-                "back_to_catalog_aria": "Return to company catalog",
-                "go_to_offers_aria": "Go to company offers section",
-                "see_offers": "See Offers",
-                "send_request_aria": "Send request to selected companies"
-            },
-            "checkout": {
-                "aria_label": "Checkout - {{company}}",
-                "close_aria": "Close checkout window",
-                "title": "Checkout",
-                "total_import_price": "Total Import Price",
-                "send_application": "Send Application",
-                "received_aria": "Application Received - {{company}}",
-                "close_confirmation_aria": "Close confirmation window",
-                "received_title": "Application Received",
-                "received_desc": "We will transfer your application to the importer and they will contact you on the next business day.",
-                "contact_importer": "Contact Importer",
-                "go_to_company": "Go to Company Page",
-                "detailed_price_aria": "Detailed Price - {{company}}",
-                "close_price_check_aria": "Close price check",
-                "fullscreen_photo_aria": "Fullscreen photo view",
-                "close": "Close"
-            }
-        },
-        "common": {
-            "name": "Name",
-            "phone": "Phone",
-            "any": "Any",
-            "close": "Close",
-            "reviews": "reviews",
-            "price": "Price"
-        }
-    }
-
-    new_keys_ka = {
-        "vehicle_details": {
-            "errors": {
-                "not_found": "ავტომობილის იდენტიფიკატორი ვერ მოიძებნა.",
-                "fill_name_phone": "გთხოვთ შეავსოთ სახელი და ტელეფონის ნომერი.",
-                "phone_min_length": "ტელეფონის ნომერი უნდა შეიცავდეს მინიმუმ 3 სიმბოლოს.",
-                "select_min_one_company": "აირჩიეთ მინიმუმ ერთი კომპანია საერთო მოთხოვნისთვის.",
-                "company_id_failed": "ვერ მოხერხდა არჩეული კომპანიების იდენტიფიკაცია.",
-                "request_failed": "ვერ მოხერხდა მოთხოვნის გაგზავნა. სცადეთ კიდევ ერთხელ."
-            },
-            "support_modal": {
-                "aria_label": "აირჩიე მეტი კომპანია მხარდაჭერისთვის",
-                "close_aria": "დახურე მხარდაჭერის ფანჯარა",
-                "title": "გახსენი არჩევანი 5 კომპანიამდე",
-                "description": "დაალაიქე ჩვენი პროექტი სოციალურ ქსელებში და დაწერე მოკლე შეფასება, რათა ერთდროულად რამდენიმე კომპანიას გაუგზავნო მოთხოვნა.",
-                "liked_project": "მე დავუჭირე მხარი პროექტს სოციალურ ქსელებში",
-                "ready_to_review": "მზად ვარ გავუზიარო მოკლე შეფასება",
-                "your_review_label": "შენი მოკლე შეფასება",
-                "unlock_btn": "გახსენი არჩევანი 5 კომპანიამდე"
-            },
-            "request_modal": {
-                "aria_label": "საერთო მოთხოვნა რამდენიმე კომპანიაზე",
-                "close_aria": "დახურე საერთო მოთხოვნის ფანჯარა",
-                "title": "საერთო მოთხოვნა რამდენიმე კომპანიაზე",
-                "selected_companies": "არჩეული კომპანიები: {{names}}",
-                "comment_label": "კომენტარი / დამატებითი სურვილები",
-                "min_budget": "მინ. ბიუჯეტი (USD)",
-                "max_budget": "მაქს. ბიუჯეტი (USD)",
-                "desired_time": "სასურველი ვადა (დღე)",
-                "max_time": "მაქს. მისაღები ვადა (დღე)",
-                "damage_tolerance": {
-                    "title": "ზიანის tolerate-იანობა",
-                    "minimal": "მინიმალური",
-                    "average": "საშუალო",
-                    "any": "ნებისმიერი"
-                },
-                "additional_services": {
-                    "title": "დამატებითი სერვისები",
-                    "full_documents": "სრული დოკუმენტები",
-                    "door_delivery": "მიწოდება მისამართზე",
-                    "customs_support": "საბაჟო მხარდაჭერა"
-                },
-                "contact_channel": {
-                    "title": "სასურველი საკონტაქტო არხი",
-                    "call": "ზარი"
-                },
-                "priority": "პრიორიტეტი",
-                "send_btn": "გაგზავნა",
-                "send_request_btn": "გაგზავნა მოთხოვნა"
-            },
-            "gallery": {
-                "zoom_aria": "გაადიდე მთავარი ფოტო სრულ ეკრანზე",
-                "prev_aria": "წინა ფოტოები",
-                "select_zoom_aria": "აირჩიე ეს ფოტო გასადიდებლად",
-                "next_aria": "შემდეგი ფოტოები",
-                "unavailable": "ფოტოები მიუწვდომელია"
-            },
-            "info": {
-                "basic_data": "ძირითადი მონაცემები",
-                "engine_transmission": "ძრავი / ტრანსმისია",
-                "color_condition": "ფერი / მდგომარეობა",
-                "damages": "დაზიანებები",
-                "keys_run_drive": "გასაღებები / Run & Drive",
-                "cylinders_equipment": "ცილინდრები / აღჭურვილობა",
-                "docs_auction": "დოკუმენტები და აუქციონი",
-                "yard_location": "აუქციონის ეზო / მდებარეობა",
-                "market_repair_value": "საბაზრო / შეკეთების ღირებულება",
-                "calculated_price": "გამოთვლილი ფასი",
-                "seller": "გამყიდველი",
-                "title_doc": "TITLE / დოკუმენტი",
-                "sale_date": "გაყიდვის თარიღი",
-                "created_updated": "შექმნა / განახლება",
-                "api_fields": "დამატებითი API ველები (დამხმარე ინფორმაცია)"
-            },
-            "offers": {
-                "title": "კომპანიების შეთავაზებები ამ ავტომობილზე",
-                "recalculating": "გადათვლა...",
-                "recalculate": "გადათვლა",
-                "compare_text": "შეადარე იმპორტის სრული ფასი და მიწოდების დრო სხვადასხვა სანდო კომპანიისგან აშშ-დან საქართველოში.",
-                "distance_to_poti": "დისტანცია ფოთამდე",
-                "total_price_disclaimer": "სრული ფასი მოიცავს ფასი მანქანის, ტრანსპორტირებას, მომსახურებისა და საბროკერო საფასურს, საბაჟო და სხვა გადასახადები წარმოდგენილია დაახლოებით.",
-                "no_offers": "ამ ეტაპზე ავტომობილის იმპორტის შეთავაზებები არ არის ნაპოვნი. სცადეთ გადათვლა ან მოგვიანებით დაბრუნება, ან მოიძიეთ სხვა ავტომობილი იმპორტისთვის.",
-                "back_to_catalog": "კატალოგში დაბრუნება",
-                "find_other": "მოძებნე სხვა ავტომობილი",
-                "best_shipping": "საუკეთესო ტრანსპორტირების ფასი",
-                "shipping_desc": "ტრანსპორტირება აშშ-დან საქართველოს პორტამდე (სხვა მომსახურება ცალკე ითვლება)",
-                "company_filter": "კომპანიების ფილტრი",
-                "fast_delivery": "სწრაფი მიწოდება",
-                "list_aria": "კომპანიების შეთავაზებების სია",
-                "premium_vip": "Premium / VIP შეთავაზებები",
-                "standard": "სტანდარტული შეთავაზებები — უფრო დაბალი ფასით",
-                "discount": "ფასდაკლება",
-                "approx_savings": "დაახლოებითი ეკონომია",
-                "individual_calc": "ინდივიდუალური გათვლა",
-                "discount_disclaimer": "ფასდაკლება აქტუალურია მიმდინარე კალკულაციისთვის და შეიძლება შეიცვალოს.",
-                "trusted_partner": "სანდო პარტნიორი",
-                "trusted_partner_desc": "სანდო პარტნიორი — ჩვენი შიდა შეფასებით და მომხმარებელთა გამოხმაურებებით შერჩეული იმპორტერი.",
-                "secure_payment": "დაცული გადახდა",
-                "secure_payment_desc": "დაცული გადახდა — თანხა იფიქსირება სანდო არხით, სანამ იმპორტერი არ დაადასტურებს მომსახურებას.",
-                "documents_full": "დოკუმენტები სრულად",
-                "documents_full_desc": "დოკუმენტები სრულად — იმპორტერი უზრუნველყოფს ყველა საჭირო იმპორტის და რეგისტრაციის დოკუმენტის მომზადებას.",
-                "documents": "დოკუმენტები",
-                "transport": "ტრანსპორტირება",
-                "customs": "საბაჟო",
-                "select_fee_aria": "გამოყავი საფასური ამ კომპანიის შეთავაზებისთვის",
-                "select_offer_aria": "აირჩიე ეს შეთავაზება ან მოხსენი არჩევანი",
-                "add_to_common_aria": "დამატება საერთო მოთხოვნაში ამ კომპანიისთვის",
-                "selected": "არჩეულია",
-                "selected_common": "არჩეულია საერთო მოთხოვნისთვის",
-                "select": "არჩევა",
-                "recent_imports": "ბოლო წარმატებული იმპორტის მაგალითები",
-                "import_completed_in": "იმპორტი დასრულდა {{days}} დღეში",
-                "see_other_auctions": "ნახე სხვა აქტიური აუქციონები",
-                "not_found_msg": "ავტომობილი ვერ მოიძებნა. სცადეთ კიდევ ერთხელ ან დაბრუნდით ძიებაზე.",
-                "continue_working": "გაგრძელე მუშაობა შეთავაზებებთან",
-                "compare_desc": "შეადარე კომპანიები, აირჩიე საუკეთესო და დაბრუნდი კატალოგში ახალი ავტომობილის სანახავად.",
-                "back_to_catalog_aria": "დაბრუნდი კომპანიების კატალოგში",
-                "go_to_offers_aria": "გადადი კომპანიების შეთავაზებების სექციაზე",
-                "see_offers": "ნახე შეთავაზებები",
-                "send_request_aria": "გაგზავნა მოთხოვნის გაგზავნა არჩეული კომპანიებისთვის"
-            },
-            "checkout": {
-                "aria_label": "შეკვეთის გაფორმება - {{company}}",
-                "close_aria": "დახურე შეკვეთის გაფორმების ფანჯარა",
-                "title": "შეკვეთის გაფორმება",
-                "total_import_price": "სრული ფასი იმპორტზე",
-                "send_application": "გაგზავნა განაცხადი",
-                "received_aria": "განაცხადი მიღებულია - {{company}}",
-                "close_confirmation_aria": "დახურე დადასტურების ფანჯარა",
-                "received_title": "განაცხადი მიღებულია",
-                "received_desc": "ჩვენ გადავცემთ თქვენს განაცხადს იმპორტერს და ის დაგიკავშირდებათ უახლოეს სამუშაო დღეს.",
-                "contact_importer": "დაუკავშირდი იმპორტერს",
-                "go_to_company": "გადადი კომპანიის გვერდზე",
-                "detailed_price_aria": "დეტალური ფასი იმპორტზე - {{company}}",
-                "close_price_check_aria": "დახურე ფასის დეტალური ჩეკი",
-                "fullscreen_photo_aria": "ფოტოს სრულეკრანიანი ჩვენება",
-                "close": "დახურვა"
-            }
-        },
-        "common": {
-            "name": "სახელი",
-            "phone": "ტელეფონი",
-            "any": "ნებისმიერი",
-            "close": "დახურვა",
-            "reviews": "შეფასება",
-            "price": "ფასი"
-        }
-    }
+    file_paths = [os.path.join(BASE_PATH, lang, "translation.json") for lang in langs]
 
-    for lang in langs:
-        file_path = os.path.join(base_path, lang, "translation.json")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        new_keys = new_keys_en if lang == "en" else new_keys_ka
-        
-        # Update common
-        if "common" not in data:
-            data["common"] = {}
-        for key, value in new_keys["common"].items():
-            data["common"][key] = value
+    # Each language is an independent read-merge-write on its own file
+    with ThreadPoolExecutor(max_workers=len(langs)) as ex:
+        results = list(ex.map(_update_one_lang, langs, file_paths))
 
-        # Update vehicle_details
-        if "vehicle_details" not in data:
-            data["vehicle_details"] = {}
-        
-        for section, content in new_keys["vehicle_details"].items():
-            if section not in data["vehicle_details"]:
-                data["vehicle_details"][section] = content
-            else:
-                # Deep merge for sections
-                for key, value in content.items():
-                    if isinstance(value, dict):
-                        if key not in data["vehicle_details"][section]:
-                             data["vehicle_details"][section][key] = value
-                        else:
-                             for k, v in value.items():
-                                 data["vehicle_details"][section][key][k] = v
-                    else:
-                        data["vehicle_details"][section][key] = value
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"Updated {file_path}")
+    # One stdout write, in language order
+    sys.stdout.write("\n".join(results) + "\n")
 
 if __name__ == "__main__":
     update_translations()
-